@@ -1,6 +1,8 @@
 import pytest
 from slugify import slugify 
 import os
+import json
+import itertools
 from pathlib import Path
 from datetime import datetime, timezone
 import logging
@@ -142,6 +144,26 @@ USERS = {
     }
 }
 
+# ===============================================================
+# CLIENT-SIDE STATE KEYS
+# ---------------------------------------------------------------
+# SauceDemo keeps its whole session in the browser:
+# - SESSION_COOKIE: cookie holding the logged-in username.
+# - CART_STORAGE_KEY: localStorage key with a JSON list of product ids.
+# - PRODUCTS: product name -> id used inside the cart list.
+# ===============================================================
+SESSION_COOKIE = "session-username"
+CART_STORAGE_KEY = "cart-contents"
+
+PRODUCTS = {
+    "Sauce Labs Backpack": 4,
+    "Sauce Labs Bike Light": 0,
+    "Sauce Labs Bolt T-Shirt": 1,
+    "Sauce Labs Fleece Jacket": 5,
+    "Sauce Labs Onesie": 2,
+    "Test.allTheThings() T-Shirt (Red)": 3,
+}
+
 # ===============================================================
 # FIXTURES FOR TEST DATA
 # ---------------------------------------------------------------
@@ -169,3 +191,43 @@ def base_url():
 def user_data():
     return USERS
 
+
+# ===============================================================
+# APP STATE SEEDING FIXTURE
+# ---------------------------------------------------------------
+# seed_app_state:
+# - Returns a helper that puts the app into a given state before
+#   the first navigation, without clicking through the UI.
+# - Sets the session cookie for the chosen user.
+# - Writes the cart into localStorage via an init script; a
+#   sessionStorage flag makes it run only once, so later cart
+#   changes (remove, finish order) are not overwritten on reload.
+# - Each call uses its own flag key, so calling it again in the
+#   same test re-seeds both the user and the cart.
+# - Navigates to the landing page (e.g. "cart.html",
+#   "checkout-step-one.html") and returns the page.
+# ===============================================================
+@pytest.fixture
+def seed_app_state(page, base_url, user_data):
+    calls = itertools.count(1)
+
+    def _seed(user_key="correctUser", cart=(), landing="inventory.html"):
+        user = user_data[user_key]
+        flag = f"qa-state-seeded-{next(calls)}"
+        cart_ids = [PRODUCTS[name] for name in cart]
+        page.context.add_cookies([{
+            "name": SESSION_COOKIE,
+            "value": user["username"],
+            "url": base_url,
+        }])
+        page.add_init_script(script=f"""
+            if (window.location.origin === {json.dumps(base_url.rstrip("/"))}
+                && !window.sessionStorage.getItem({json.dumps(flag)})) {{
+                window.localStorage.setItem({json.dumps(CART_STORAGE_KEY)}, {json.dumps(json.dumps(cart_ids))});
+                window.sessionStorage.setItem({json.dumps(flag)}, "true");
+            }}
+        """)
+        page.goto(f"{base_url}{landing}")
+        logging.info(f"[state] seeded {user['username']} with cart {cart_ids} -> {landing}")
+        return page
+    return _seed
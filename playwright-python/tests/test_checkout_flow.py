@@ -118,34 +118,26 @@ def test_positive_full_flow(page, base_url, user_data):
 # ---------------------------------------------------------------
 # Purpose:
 # - Validate a user can complete checkout successfully.
+# - Starts from a seeded cart; UI add-to-cart is covered by
+#   test_positive_full_flow.
 # ===============================================================
 @pytest.mark.order(9)
-def test_checkout_happy_path(page, base_url, user_data):
+def test_checkout_happy_path(seed_app_state, base_url):
     logging.info("=== Starting Checkout Happy Path Test ===")
-    user = user_data["correctUser"]
 
     # -----------------------------------------------------------
-    # 1️⃣ LOGIN STAGE
+    # 1️⃣ START WITH ONE PRODUCT IN THE CART
     # -----------------------------------------------------------
-    page.goto(base_url)
-    logging.info("Navigated to SauceDemo base URL.")
-    page.get_by_placeholder("Username").fill(user["username"])
-    page.get_by_placeholder("Password").fill(user["password"])
-    page.get_by_role("button", name="Login").click()
-    page.get_by_text("Products").wait_for(timeout=5000)
-    assert "/inventory.html" in page.url
-    logging.info("User logged in successfully.")
-    take_screenshot(page, "checkout-login")
+    page = seed_app_state("correctUser", cart=["Sauce Labs Backpack"], landing="cart.html")
+    assert "/cart.html" in page.url
+    expect(page.locator(".cart_item")).to_have_count(1)
+    expect(page.locator(".inventory_item_name")).to_have_text("Sauce Labs Backpack")
+    logging.info("Cart seeded with one product.")
+    take_screenshot(page, "checkout-cart")
 
     # -----------------------------------------------------------
-    # 2️⃣ ADD FIRST PRODUCT TO CART
+    # 2️⃣ OPEN CHECKOUT FORM
     # -----------------------------------------------------------
-    page.locator('.inventory_item').first.locator('a[id$="_title_link"]').click()
-    logging.info("Opened first product details page.")
-    page.get_by_role("button", name="Add to cart").click()
-    take_screenshot(page, "product-added")
-    logging.info("Product added to cart.")
-    page.locator(".shopping_cart_link").click()
     page.locator("[id='checkout']").click()
     logging.info("Navigated to checkout form.")
 
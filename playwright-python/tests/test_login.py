@@ -33,84 +33,40 @@ def test_login_success(page, base_url, user_data):
 
 
 # ===============================================================
-# TEST 2️⃣ – Problem User Scenario (Known UI & Checkout Bugs)
+# TEST 2️⃣ – Problem User Checkout Bug
 # ---------------------------------------------------------------
 # Purpose:
-# - Test login with "problem_user" and verify known UI inconsistencies.
-# - Ensure product list loads and Add to Cart buttons are functional.
+# - Start "problem_user" directly on the checkout form with a
+#   seeded cart (no clicks through the inventory).
 # - Reproduce checkout form corruption bug specific to this user.
+# - Login and add-to-cart are covered by
+#   test_login_special_user_add_to_cart.
 # Expected Bugs:
-# - Product images are identical.
-# - Add-to-Cart buttons behave inconsistently.
 # - Typing a single char into “Last Name” corrupts “First Name” field.
 # ===============================================================
 @pytest.mark.order(2)
-def test_login_problem(page, base_url, user_data):
-    logging.info("Running test_login_problemUser")
-    user = user_data["problemUser"]
+def test_checkout_problemUser(seed_app_state):
+    logging.info("Running test_checkout_problemUser")
 
     # -----------------------------------------------------------
-    # 1️⃣ LOGIN AND VERIFY HEADER
+    # 1️⃣ SEED SESSION AND CART, VERIFY HEADER
     # -----------------------------------------------------------
-    page.goto(base_url)
-    page.get_by_placeholder("Username").fill(user["username"])
-    page.get_by_placeholder("Password").fill(user["password"])
-    page.locator("//input[@id='login-button']").click()
-    page.get_by_text("Products").wait_for(timeout=5000)
-    assert "/inventory.html" in page.url, "Fail Login."
+    page = seed_app_state(
+        "problemUser",
+        cart=["Sauce Labs Backpack", "Sauce Labs Bike Light"],
+        landing="checkout-step-one.html",
+    )
+    expect(page.get_by_text("Checkout: Your Information")).to_be_visible(timeout=5000)
+    expect(page.locator(".shopping_cart_badge")).to_have_text("2")
 
     # Verify “Swag Labs” header text
     header_text = page.locator("div.app_logo")
     expect(header_text).to_contain_text("Swag Labs")
     logging.info("Verified that the page header contains 'Swag Labs'.")
+    take_screenshot(page, name="problem_user_checkout_form")
 
     # -----------------------------------------------------------
-    # 2️⃣ VERIFY PRODUCT LIST
-    # -----------------------------------------------------------
-    names_locator = page.locator(".inventory_item_name")
-    total_products = names_locator.count()
-    assert total_products > 0, "No products found."
-
-    # -----------------------------------------------------------
-    # 3️⃣ ADD TO CART FUNCTIONALITY
-    # -----------------------------------------------------------
-    add_buttons = page.locator("button.btn_inventory")
-    total_buttons = add_buttons.count()
-    logging.info(f"{total_buttons} 'Add to cart' buttons found.")
-    assert total_buttons == total_products, "Add-to-Cart button count mismatch."
-    take_screenshot(page, name="products_page_problem_user")
-
-    for i in range(total_buttons):
-        button = add_buttons.nth(i)
-        try:
-            if button.is_visible() and button.is_enabled():
-                button.click()
-                logging.info(f"{i+1}. product added.")
-            else:
-                logging.info(f"{i+1}. product button inactive.")
-        except Exception as e:
-            logging.info(f"{i+1}. product could not be clicked: {e}")
-
-    # -----------------------------------------------------------
-    # 4️⃣ VERIFY THE NUMBER IN THE CART
-    # -----------------------------------------------------------
-    cart_badge = page.locator(".shopping_cart_badge")
-    if cart_badge.is_visible():
-        cart_count = int(cart_badge.inner_text().strip())
-        logging.info(f"There are {cart_count} items in the cart.")
-        assert cart_count > 0, "The cart should not be empty."
-    else:
-        logging.info("Cart badge is not visible — probably no items were added.")
-
-    # -----------------------------------------------------------
-    # 5️⃣ PROCEED TO CHECKOUT
-    # -----------------------------------------------------------
-    page.locator(".shopping_cart_link").click()
-    page.locator("#checkout").click()
-    expect(page.get_by_text("Checkout: Your Information")).to_be_visible(timeout=5000)
-
-    # -----------------------------------------------------------
-    # 6️⃣ REPRODUCE CHECKOUT FORM BUG
+    # 2️⃣ REPRODUCE CHECKOUT FORM BUG
     # -----------------------------------------------------------
     first = page.get_by_placeholder("First Name")
     last = page.get_by_placeholder("Last Name")
@@ -136,7 +92,7 @@ def test_login_problem(page, base_url, user_data):
     page.get_by_role("button", name="Continue").click()
 
     # -----------------------------------------------------------
-    # 7️⃣ VERIFY EXPECTED ERROR MESSAGE
+    # 3️⃣ VERIFY EXPECTED ERROR MESSAGE
     # -----------------------------------------------------------
     error_banner = page.locator("[data-test='error']")
     expect(error_banner).to_be_visible(timeout=5000)
@@ -144,7 +100,7 @@ def test_login_problem(page, base_url, user_data):
     logging.info("Error banner appeared as expected for corrupted checkout form.")
 
     # -----------------------------------------------------------
-    # 8️⃣ CAPTURE FINAL SCREENSHOT
+    # 4️⃣ CAPTURE FINAL SCREENSHOT
     # -----------------------------------------------------------
     take_screenshot(page, name="problem_user_checkout_error")
     logging.info("Screenshot captured for corrupted checkout state.")
@@ -152,53 +108,31 @@ def test_login_problem(page, base_url, user_data):
 
 
 # ===============================================================
-# TEST 3️⃣ – Error User Scenario
+# TEST 3️⃣ – Error User Checkout Bugs
 # ---------------------------------------------------------------
 # Purpose:
 # - Verify that the page header contains "Swag Labs"
-# - Validate checkout flow with “error_user”.
+# - Validate checkout flow with “error_user”, starting on the
+#   checkout form with a seeded cart.
+# - Login and add-to-cart are covered by
+#   test_login_special_user_add_to_cart.
 # - Known behavior: Checkout button visible but not clickable.
 # Expected Bugs:
 # - “Last Name” field not fillable.
 # - “Finish” button is visible but cannot be clicked.
 # ===============================================================
 @pytest.mark.order(3)
-def test_login_errorUser(page, base_url, user_data):
-    user = user_data["errorUser"]
-    page.goto(base_url)
-    page.get_by_placeholder("Username").fill(user["username"])
-    page.get_by_placeholder("Password").fill(user["password"])
-    page.locator("//input[@id='login-button']").click()
-    page.get_by_text("Products").wait_for(timeout=5000)
-    assert "/inventory.html" in page.url, "Fail Login."
+def test_checkout_errorUser(seed_app_state):
+    page = seed_app_state(
+        "errorUser",
+        cart=["Sauce Labs Backpack", "Sauce Labs Bike Light"],
+        landing="checkout-step-one.html",
+    )
+    expect(page.get_by_text("Checkout: Your Information")).to_be_visible(timeout=5000)
     header_text = page.locator("div.app_logo")
     expect(header_text).to_contain_text("Swag Labs")
     logging.info("Verified that the page header contains 'Swag Labs'.")
-
-    names_locator = page.locator(".inventory_item_name")
-    total_products = names_locator.count()
-    assert total_products > 0, "No products found."
-
-    add_buttons = page.locator("button.btn_inventory")
-    total_buttons = add_buttons.count()
-    logging.info(f"{total_buttons} 'Add to cart' buttons found.")
-    take_screenshot(page, name="error_user_products_page")
-
-    for i in range(total_buttons):
-        button = add_buttons.nth(i)
-        try:
-            if button.is_visible() and button.is_enabled():
-                button.click()
-                logging.info(f"{i+1}. product added.")
-            else:
-                logging.info(f"{i+1}. product button inactive.")
-        except Exception as e:
-            logging.info(f"{i+1}. product could not be clicked: {e}")
-
-    # Proceed to checkout
-    page.locator(".shopping_cart_link").click()
-    page.locator("#checkout").click()
-    expect(page.get_by_text("Checkout: Your Information")).to_be_visible(timeout=5000)
+    take_screenshot(page, name="error_user_checkout_form")
 
     # Known issue: Last Name cannot be filled
     page.get_by_placeholder("First Name").fill("John")
@@ -298,3 +232,73 @@ def test_login_failure(page, base_url, user_data, login_failure_users):
         expect(error_banner).to_contain_text("Epic sadface")
         assert "/inventory.html" not in page.url
         take_screenshot(page, name=f"login_failure_{key}")
+
+
+# ===============================================================
+# TEST 7️⃣ – Problem / Error User Login and Add to Cart
+# ---------------------------------------------------------------
+# Purpose:
+# - Log in through the form as "problem_user" and "error_user".
+# - Ensure product list loads and Add to Cart buttons are present.
+# - Click every Add to Cart button and check the cart badge.
+# Expected Bugs:
+# - problem_user: product images are identical.
+# - Add-to-Cart buttons behave inconsistently for both users.
+# ===============================================================
+@pytest.mark.order(7)
+@pytest.mark.parametrize("user_key", ["problemUser", "errorUser"])
+def test_login_special_user_add_to_cart(page, base_url, user_data, user_key):
+    logging.info(f"Running test_login_special_user_add_to_cart[{user_key}]")
+    user = user_data[user_key]
+
+    # -----------------------------------------------------------
+    # 1️⃣ LOGIN AND VERIFY HEADER
+    # -----------------------------------------------------------
+    page.goto(base_url)
+    page.get_by_placeholder("Username").fill(user["username"])
+    page.get_by_placeholder("Password").fill(user["password"])
+    page.locator("//input[@id='login-button']").click()
+    page.get_by_text("Products").wait_for(timeout=5000)
+    assert "/inventory.html" in page.url, "Fail Login."
+
+    header_text = page.locator("div.app_logo")
+    expect(header_text).to_contain_text("Swag Labs")
+    logging.info("Verified that the page header contains 'Swag Labs'.")
+
+    # -----------------------------------------------------------
+    # 2️⃣ VERIFY PRODUCT LIST
+    # -----------------------------------------------------------
+    names_locator = page.locator(".inventory_item_name")
+    total_products = names_locator.count()
+    assert total_products > 0, "No products found."
+
+    # -----------------------------------------------------------
+    # 3️⃣ ADD TO CART FUNCTIONALITY
+    # -----------------------------------------------------------
+    add_buttons = page.locator("button.btn_inventory")
+    total_buttons = add_buttons.count()
+    logging.info(f"{total_buttons} 'Add to cart' buttons found.")
+    assert total_buttons == total_products, "Add-to-Cart button count mismatch."
+    take_screenshot(page, name=f"products_page_{user_key}")
+
+    for i in range(total_buttons):
+        button = add_buttons.nth(i)
+        try:
+            if button.is_visible() and button.is_enabled():
+                button.click()
+                logging.info(f"{i+1}. product added.")
+            else:
+                logging.info(f"{i+1}. product button inactive.")
+        except Exception as e:
+            logging.info(f"{i+1}. product could not be clicked: {e}")
+
+    # -----------------------------------------------------------
+    # 4️⃣ VERIFY THE NUMBER IN THE CART
+    # -----------------------------------------------------------
+    cart_badge = page.locator(".shopping_cart_badge")
+    if cart_badge.is_visible():
+        cart_count = int(cart_badge.inner_text().strip())
+        logging.info(f"There are {cart_count} items in the cart.")
+        assert cart_count > 0, "The cart should not be empty."
+    else:
+        logging.info("Cart badge is not visible — probably no items were added.")